@@ -59,7 +59,7 @@ def _render_text_report(*, boss_actor: str, events, row_index_start: int | None
                 (
                     e
                     for e in reversed(row.events)
-                    if e.type == EventType.TURN_END and e.actor == row.actor
+                    if e.type is EventType.TURN_END and e.actor == row.actor
                 ),
                 None,
             )
@@ -75,7 +75,7 @@ def _render_text_report(*, boss_actor: str, events, row_index_start: int | None
 
     def _skill_token_for_row(row) -> str | None:
         for e in row.events:
-            if e.type == EventType.SKILL_CONSUMED:
+            if e.type is EventType.SKILL_CONSUMED:
                 skill_id = e.data.get("skill_id")
                 if isinstance(skill_id, str) and skill_id.strip():
                     return skill_id.strip()
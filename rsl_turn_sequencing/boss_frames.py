@@ -40,7 +40,7 @@ def group_events_into_boss_frames(
     for e in events:
         current.append(e)
 
-        if e.type == EventType.TURN_END and e.actor == boss_actor:
+        if e.type is EventType.TURN_END and e.actor == boss_actor:
             boss_turn_index += 1
             frames.append(BossTurnFrame(boss_turn_index=boss_turn_index, events=tuple(current)))
             current = []
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Callable, Protocol
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Protocol
 
 from rsl_turn_sequencing.effects import (
     apply_turn_start_effects,
@@ -17,6 +18,9 @@ from rsl_turn_sequencing.skill_provider import build_hit_provider_from_battle_pa
 TM_GATE = 1430.0
 EPS = 1e-9
 
+# Phase labels as they appear in event payloads (computed once).
+_PHASE_TURN_END = str(EventType.TURN_END)
+
 
 class ExpirationResolver(Protocol):
     """Phase-aware expiration resolver.
@@ -350,7 +354,7 @@ def build_actors_from_battle_spec(
         )
         actor.blessings = _blessings_for(actor.name)
         # Hydrate A1 hits for counterattack modeling.
-        actor._a1_hits = _a1_hits_for(actor.name)  # type: ignore[attr-defined]
+        actor._a1_hits = _a1_hits_for(actor.name)
         actors.append(actor)
 
     boss = getattr(spec, 'boss')
@@ -373,7 +377,7 @@ def build_actors_from_battle_spec(
         skill_sequence=list(getattr(boss, 'skill_sequence')) if getattr(boss, 'skill_sequence', None) is not None else None,
     )
     boss_actor.blessings = _blessings_for(boss_actor.name)
-    boss_actor._a1_hits = _a1_hits_for(boss_actor.name)  # type: ignore[attr-defined]
+    boss_actor._a1_hits = _a1_hits_for(boss_actor.name)
     actors.append(boss_actor)
 
     return actors
@@ -413,6 +417,96 @@ class MasteryProcRequester:
         return list(self._schedule.get(s, []))
 
 
+# Shared (read-only) empty per-entity schedule for champions without proc requests.
+_NO_STEPS: Mapping[int, tuple[dict[str, Any], ...]] = MappingProxyType({})
+
+
+def _copy_procs(procs: tuple[dict[str, Any], ...]) -> list[dict[str, Any]]:
+    """Fresh list of fresh proc dicts (the engine contract is list[dict])."""
+    return [dict(p) for p in procs]
+
+
+class _ChampionScopedRequester(MasteryProcRequester):
+    """Requester that supports champion-scoped calls and legacy introspection.
+
+    Call contract (preferred):
+      requester({"champion_name": str, "skill_sequence_step": int}) -> list[dict]
+
+    Back-compat call contract (discouraged):
+      requester({"turn_counter": int}) -> list[dict]
+      This returns the UNION of all entities' requests for that numeric step.
+    """
+
+    def __init__(self, schedule: dict[str, dict[int, list[dict[str, Any]]]]):
+        # Keep base type/duck compatibility; we don't use the base schedule.
+        super().__init__({})
+        self.emit_on_turn_start = True
+
+        # The schedule is fixed once built, so freeze each step's procs into a
+        # tuple and resolve the legacy union-by-step view here rather than on
+        # each call. Lookups return fresh proc dicts (_copy_procs), so callers
+        # can never mutate the stored schedule.
+        self._schedule_by_entity: dict[str, dict[int, tuple[dict[str, Any], ...]]] = {
+            name: {int(step_i): tuple(procs) for step_i, procs in per_step.items()}
+            for name, per_step in schedule.items()
+        }
+        union: dict[int, list[dict[str, Any]]] = {}
+        for per_step in schedule.values():
+            for step_i, procs in per_step.items():
+                union.setdefault(int(step_i), []).extend(procs)
+        self._union_by_step: dict[int, tuple[dict[str, Any], ...]] = {
+            step_i: tuple(procs) for step_i, procs in union.items()
+        }
+
+    def __call__(self, ctx: dict[str, Any]) -> list[dict[str, Any]]:
+        if not isinstance(ctx, dict):
+            return []
+
+        champ = ctx.get("champion_name")
+        step = ctx.get("skill_sequence_step")
+        if isinstance(champ, str):
+            try:
+                step_i = int(step)
+            except Exception:
+                step_i = None
+            if step_i is not None and step_i > 0:
+                return _copy_procs(self._schedule_by_entity.get(champ, _NO_STEPS).get(step_i, ()))
+
+        # Legacy union-by-step support (kept for older tests/tools)
+        turn_counter = ctx.get("turn_counter")
+        try:
+            step_i = int(turn_counter)
+        except Exception:
+            return []
+        if step_i <= 0:
+            return []
+        return _copy_procs(self._union_by_step.get(step_i, ()))
+
+    def steps(self) -> list[int]:
+        # Union of steps across all entities (legacy introspection)
+        return sorted(self._union_by_step.keys())
+
+    def mastery_procs_for_step(self, step: int) -> list[dict[str, Any]]:
+        # Union across all entities (legacy introspection)
+        try:
+            step_i = int(step)
+        except Exception:
+            return []
+        if step_i <= 0:
+            return []
+        return _copy_procs(self._union_by_step.get(step_i, ()))
+
+    def mastery_procs_for_champion_step(self, champion_name: str, step: int) -> list[dict[str, Any]]:
+        # Optional richer introspection (not required by engine).
+        try:
+            step_i = int(step)
+        except Exception:
+            return []
+        if not isinstance(champion_name, str) or not champion_name.strip() or step_i <= 0:
+            return []
+        return _copy_procs(self._schedule_by_entity.get(champion_name, _NO_STEPS).get(step_i, ()))
+
+
 def build_mastery_proc_requester_from_battle_path(battle_path: Path) -> MasteryProcRequester | None:
     """Build a mastery proc requester from a battle spec JSON file.
 
@@ -435,8 +529,31 @@ def build_mastery_proc_requester_from_battle_path(battle_path: Path) -> MasteryP
         raw = json.loads(battle_path.read_text(encoding="utf-8"))
     except Exception:
         return None
+    return build_mastery_proc_requester(raw)
 
-    if not isinstance(raw, dict):
+
+def build_mastery_proc_requester(battle_spec: object) -> MasteryProcRequester | None:
+    """Build a mastery proc requester from an already-parsed battle spec.
+
+    Same semantics and return contract as build_mastery_proc_requester_from_battle_path,
+    for callers that hold the spec in memory. Returns None if `battle_spec` is not a dict.
+    Proc request dicts are copied, so later edits to `battle_spec` do not leak into
+    the requester.
+
+    Expected shape (as parsed from battle_spec.json):
+      {
+        "boss": {"name": str, "turn_overrides": {...}},
+        "champions": [{"name": str, "turn_overrides": {...}}, ...],
+        ...
+      }
+
+    where each entity's schedule lives at:
+      entity["turn_overrides"]["proc_request"]["on_step"]
+        = {"<step>": {"mastery_procs": [{"holder": str, "mastery": str, "count": int}, ...]}}
+
+    Root-level `turn_overrides` are ignored (ADR-001).
+    """
+    if not isinstance(battle_spec, dict):
         return None
 
     # schedule_by_entity[entity_name][skill_sequence_step] -> list[proc_dict]
@@ -474,7 +591,7 @@ def build_mastery_proc_requester_from_battle_path(battle_path: Path) -> MasteryP
             if step_i <= 0:
                 continue
 
-            cleaned: list[dict[str, Any]] = [p for p in procs if isinstance(p, dict)]
+            cleaned: list[dict[str, Any]] = [dict(p) for p in procs if isinstance(p, dict)]
             if not cleaned:
                 continue
             schedule_by_entity.setdefault(entity_name, {}).setdefault(step_i, []).extend(cleaned)
@@ -482,13 +599,13 @@ def build_mastery_proc_requester_from_battle_path(battle_path: Path) -> MasteryP
     # NOTE: ADR-001 removes the meaning of root-level scheduling.
     # We intentionally do NOT merge root-level `turn_overrides` into the schedule.
 
-    boss = raw.get("boss")
+    boss = battle_spec.get("boss")
     boss_pair = _extract_on_step(boss)
     if boss_pair is not None:
         entity_name, on_step = boss_pair
         _merge_on_step(entity_name, on_step)
 
-    champions = raw.get("champions")
+    champions = battle_spec.get("champions")
     if isinstance(champions, list):
         for ch in champions:
             pair = _extract_on_step(ch)
@@ -497,80 +614,6 @@ def build_mastery_proc_requester_from_battle_path(battle_path: Path) -> MasteryP
             entity_name, on_step = pair
             _merge_on_step(entity_name, on_step)
 
-    class _ChampionScopedRequester(MasteryProcRequester):
-        """Requester that supports champion-scoped calls and legacy introspection.
-
-        Call contract (preferred):
-          requester({"champion_name": str, "skill_sequence_step": int}) -> list[dict]
-
-        Back-compat call contract (discouraged):
-          requester({"turn_counter": int}) -> list[dict]
-          This returns the UNION of all entities' requests for that numeric step.
-        """
-
-        def __init__(self, schedule: dict[str, dict[int, list[dict[str, Any]]]]):
-            # Keep base type/duck compatibility; we don't use the base schedule.
-            super().__init__({})
-            self._schedule_by_entity = schedule
-            self.emit_on_turn_start = True
-
-        def __call__(self, ctx: dict[str, Any]) -> list[dict[str, Any]]:
-            if not isinstance(ctx, dict):
-                return []
-
-            champ = ctx.get("champion_name")
-            step = ctx.get("skill_sequence_step")
-            if isinstance(champ, str):
-                try:
-                    step_i = int(step)
-                except Exception:
-                    step_i = None
-                if step_i is not None and step_i > 0:
-                    return list(self._schedule_by_entity.get(champ, {}).get(step_i, []))
-
-            # Legacy union-by-step support (kept for older tests/tools)
-            turn_counter = ctx.get("turn_counter")
-            try:
-                step_i = int(turn_counter)
-            except Exception:
-                return []
-            if step_i <= 0:
-                return []
-            out: list[dict[str, Any]] = []
-            for _entity, per_step in self._schedule_by_entity.items():
-                out.extend(list(per_step.get(step_i, [])))
-            return out
-
-        def steps(self) -> list[int]:
-            # Union of steps across all entities (legacy introspection)
-            s: set[int] = set()
-            for per_step in self._schedule_by_entity.values():
-                s.update(int(k) for k in per_step.keys())
-            return sorted(s)
-
-        def mastery_procs_for_step(self, step: int) -> list[dict[str, Any]]:
-            # Union across all entities (legacy introspection)
-            try:
-                step_i = int(step)
-            except Exception:
-                return []
-            if step_i <= 0:
-                return []
-            out: list[dict[str, Any]] = []
-            for per_step in self._schedule_by_entity.values():
-                out.extend(list(per_step.get(step_i, [])))
-            return out
-
-        def mastery_procs_for_champion_step(self, champion_name: str, step: int) -> list[dict[str, Any]]:
-            # Optional richer introspection (not required by engine).
-            try:
-                step_i = int(step)
-            except Exception:
-                return []
-            if not isinstance(champion_name, str) or not champion_name.strip() or step_i <= 0:
-                return []
-            return list(self._schedule_by_entity.get(champion_name, {}).get(step_i, []))
-
     return _ChampionScopedRequester(schedule_by_entity)
 
 
@@ -1055,8 +1098,14 @@ def run_ticks(
 
     hit_contribution_resolver = _resolver_with_boss_overrides if boss_turn_override_provider is not None else None
 
+    # Boss-turn counting only needs the event log when a stop condition is set;
+    # otherwise ticks run back to back with no per-tick bookkeeping.
+    track_boss_turns = stop_after_boss_turns is not None
+    before_len = 0
+
     for _ in range(int(ticks)):
-        before_len = len(getattr(event_sink, "events", []) or [])
+        if track_boss_turns:
+            before_len = len(getattr(event_sink, "events", []) or [])
         step_tick(
             actors,
             event_sink=event_sink,
@@ -1066,7 +1115,7 @@ def run_ticks(
             effect_placement_provider=effect_placement_provider,
         )
 
-        if stop_after_boss_turns is not None:
+        if track_boss_turns:
             new_events = (getattr(event_sink, "events", []) or [])[before_len:]
             for evt in new_events:
                 if _is_boss_turn_end_event(evt):
@@ -1075,6 +1124,48 @@ def run_ticks(
                         return
 
 
+def _fill_and_select_ready_actor(
+        actors: list[Actor],
+        *,
+        apply_effects: bool = True,
+) -> tuple[int, Actor | None]:
+    """Apply the simultaneous fill and pick the tick winner in the same pass.
+
+    Returns (index, actor) of the actor at or past TM_GATE with the highest
+    turn_meter (then higher speed, then earlier list position), or (-1, None)
+    when nobody is ready. An actor's post-fill meter is final for this tick, so
+    it can be compared as soon as it is written. Meters are mutable from outside
+    the engine (tests, TM effects, resets), so there is no cached ordering to
+    keep in sync.
+
+    apply_effects=False fills with speed * speed_multiplier only (step_tick_debug).
+    """
+    i_best = -1
+    best: Actor | None = None
+    best_tm = 0.0
+    best_speed = 0.0
+    # Loop-invariant names bound as locals once per tick rather than looked up
+    # as globals once per actor.
+    gate = TM_GATE
+    eps = EPS
+    multiplier_from_effects = speed_multiplier_from_effects
+    for i, a in enumerate(actors):
+        speed = a.speed
+        # speed/speed_multiplier are float fields (builders coerce spec values),
+        # so the product needs no per-tick float() conversion.
+        eff_speed = speed * a.speed_multiplier
+        # Most actors carry no effects; skip the multiplier call for them.
+        if apply_effects and a.effects:
+            eff_speed *= multiplier_from_effects(a.effects)
+        tm = a.turn_meter + eff_speed
+        a.turn_meter = tm
+        if tm + eps < gate:
+            continue
+        if best is None or tm > best_tm or (tm == best_tm and speed > best_speed):
+            i_best, best, best_tm, best_speed = i, a, tm, speed
+    return i_best, best
+
+
 def _boss_shield_snapshot(actors: list[Actor]) -> dict[str, object] | None:
     """Observer-only: derive current boss shield state from the actor list."""
     boss = next((a for a in actors if bool(getattr(a, "is_boss", False))), None)
@@ -1101,7 +1192,7 @@ def _decrement_active_effect_durations_turn_end(actor: Actor, *, turn_counter: i
     This updates `actor.active_effects` in-place by replacing frozen EffectInstances.
     Expiration/removal is intentionally NOT performed here.
     """
-    current = list(getattr(actor, "active_effects", []) or [])
+    current = getattr(actor, "active_effects", None) or ()
     if not current:
         return {}
 
@@ -1122,6 +1213,12 @@ def _decrement_active_effect_durations_turn_end(actor: Actor, *, turn_counter: i
             else:
                 new_d = max(0, d0 - 1) if d0 > 0 else 0
 
+            # Instances whose duration is unchanged (placement turn, already at 0)
+            # are kept as-is; only a real decrement allocates a replacement.
+            if new_d == d0:
+                updated.append(fx)
+                continue
+
             updated.append(
                 EffectInstance(
                     instance_id=iid,
@@ -1153,7 +1250,7 @@ def _emit_effect_duration_changed_events(
     Designed to keep duration logic observable in CLI/event logs without tests needing
     to infer duration from indirect behavior.
     """
-    current = list(getattr(owner, "active_effects", []) or [])
+    current = getattr(owner, "active_effects", None) or ()
     if not current:
         return
 
@@ -1201,7 +1298,7 @@ def _expire_active_effects_turn_end(
       If a BUFF placed by Mikage expires AND a deterministic proc request exists
       for this step (turn_counter), emit MASTERY_PROC with the requested payload.
     """
-    current = list(getattr(owner, "active_effects", []) or [])
+    current = getattr(owner, "active_effects", None) or ()
     if not current:
         return
 
@@ -1238,7 +1335,7 @@ def _expire_active_effects_turn_end(
             # Use duration BEFORE decrement for observability and consistency with injected expiration.
             duration=int(duration_before.get(iid, int(getattr(fx, "duration", 0)))),
             reason="duration_reached_zero",
-            phase=str(EventType.TURN_END),
+            phase=_PHASE_TURN_END,
         )
 
         # Slice A: record qualifying expirations for deterministic validation.
@@ -1264,7 +1361,10 @@ def _resolve_external_expirations_for_phase(
             "turn_counter": int(turn_counter),
             "tick": int(event_sink.current_tick),
         }
-    ) or []
+    )
+    if not injected:
+        # Common case: nothing to expire at this phase.
+        return
 
     for item in injected:
         if not isinstance(item, dict):
@@ -1339,7 +1439,7 @@ def _expire_effect_instance_by_id(*, actors: list["Actor"], instance_id: str):
         current = getattr(a, "active_effects", None)
         if not current:
             continue
-        for i, fx in enumerate(list(current)):
+        for i, fx in enumerate(current):
             if getattr(fx, "instance_id", None) == instance_id:
                 removed = current.pop(i)
                 return a, removed
@@ -1446,7 +1546,10 @@ def _resolve_guarded_mastery_procs_for_qualifying_expirations(
                 "skill_sequence_step": int(step_i),
                 "turn_counter": int(turn_counter),  # legacy observability only
             }
-        ) or []
+        )
+        if not requested:
+            # Common case: nothing declared for this (holder, step).
+            continue
         if not isinstance(requested, list):
             raise ValueError("mastery_proc_requester must return a list of proc dicts")
 
@@ -1479,7 +1582,7 @@ def _resolve_guarded_mastery_procs_for_qualifying_expirations(
                 qualifying_count=int(q_i),
                 # Slice D / D5: prefer explicit naming while retaining legacy field.
                 qualifying_expiration_count=int(q_i),
-                resolution_phase=str(EventType.TURN_END),
+                resolution_phase=_PHASE_TURN_END,
                 resolution_step=int(step_i),
                 skill_sequence_step=int(step_i),
                 turn_counter=int(turn_counter),
@@ -1497,7 +1600,7 @@ def _resolve_guarded_mastery_procs_for_qualifying_expirations(
             count=int(requested_total),
             # Slice D / D2: success-path causal attribution (observability only).
             qualifying_expiration_count=int(q_i),
-            resolution_phase=str(EventType.TURN_END),
+            resolution_phase=_PHASE_TURN_END,
             resolution_step=int(step_i),
             skill_sequence_step=int(step_i),
             turn_counter=int(turn_counter),  # legacy observability only
@@ -1539,7 +1642,10 @@ def _resolve_guarded_mastery_procs_for_qualifying_expirations(
                 "skill_sequence_step": int(step_i),
                 "turn_counter": int(turn_counter),  # legacy observability only
             }
-        ) or []
+        )
+        if not requested:
+            # Common case: nothing declared for this (holder, step).
+            continue
         if not isinstance(requested, list):
             raise ValueError("mastery_proc_requester must return a list of proc dicts")
 
@@ -1570,7 +1676,7 @@ def _resolve_guarded_mastery_procs_for_qualifying_expirations(
             qualifying_count=0,
             # Slice D / D5: prefer explicit naming while retaining legacy field.
             qualifying_expiration_count=0,
-            resolution_phase=str(EventType.TURN_END),
+            resolution_phase=_PHASE_TURN_END,
             resolution_step=int(step_i),
             skill_sequence_step=int(step_i),
             turn_counter=int(turn_counter),
@@ -1622,20 +1728,15 @@ def _emit_requested_mastery_procs_once(
     if key in emitted_keys:
         return
 
-    last_type = None
-    try:
-        if getattr(event_sink, "events", None):
-            last_type = getattr(event_sink.events[-1], "type", None)
-    except Exception:
-        last_type = None
-
     requested = mastery_proc_requester(
         {
             "champion_name": acting_actor,
             "skill_sequence_step": int(step_i),
             "turn_counter": int(turn_counter),  # legacy observability only
         }
-    ) or []
+    )
+    if not requested:
+        return
     if not isinstance(requested, list):
         raise ValueError("mastery_proc_requester must return a list of proc dicts")
 
@@ -1677,6 +1778,14 @@ def _emit_requested_mastery_procs_once(
 
     if total <= 0:
         return
+
+    last_type = None
+    try:
+        if getattr(event_sink, "events", None):
+            last_type = getattr(event_sink.events[-1], "type", None)
+    except Exception:
+        last_type = None
+
     # Ensure ordering contract for downstream consumers/tests:
     # EFFECT_EXPIRED -> MASTERY_PROC -> TURN_END.
     if last_type != EventType.EFFECT_EXPIRED:
@@ -1791,9 +1900,9 @@ def step_tick(
         expiration_resolver = expiration_injector  # type: ignore[assignment]
 
     # 0) extra turn handling (no fill)
-    extra_candidates = [(i, a) for i, a in enumerate(actors) if int(a.extra_turns) > 0]
-    if extra_candidates:
-        i_best, best = extra_candidates[0]
+    extra_candidate = next(((i, a) for i, a in enumerate(actors) if int(a.extra_turns) > 0), None)
+    if extra_candidate is not None:
+        i_best, best = extra_candidate
         best.extra_turns = int(best.extra_turns) - 1
         is_extra_turn = True
     else:
@@ -1809,13 +1918,9 @@ def step_tick(
 
     # 1) simultaneous fill (only if no extra turn was granted)
     if best is None:
-        for a in actors:
-            eff_speed = (
-                    float(a.speed)
-                    * float(a.speed_multiplier)
-                    * float(speed_multiplier_from_effects(a.effects))
-            )
-            a.turn_meter += eff_speed
+        # 2-3) find ready actors and choose one while filling:
+        # highest TM, then speed, then list order
+        i_best, best = _fill_and_select_ready_actor(actors)
 
         if event_sink is not None:
             event_sink.emit(
@@ -1829,19 +1934,9 @@ def step_tick(
                 ],
             )
 
-        # 2) find all ready actors
-        ready = [a for a in actors if a.turn_meter + EPS >= TM_GATE]
-        if not ready:
+        if best is None:
             return None
 
-        # 3) choose actor: highest TM, then speed, then list order
-        indexed = list(enumerate(actors))
-        ready_indexed = [(i, a) for (i, a) in indexed if a.turn_meter + EPS >= TM_GATE]
-        i_best, best = max(
-            ready_indexed,
-            key=lambda t: (t[1].turn_meter, t[1].speed, -t[0]),
-        )
-
     if event_sink is not None:
         event_sink.emit(
             EventType.WINNER_SELECTED,
@@ -2128,7 +2223,7 @@ def step_tick(
     # Optional snapshot capture at TURN_END (observer-only)
     if event_sink is not None:
         if (
-                snapshot_capture is not None
+                snapshot_capture
                 and event_sink.current_tick in snapshot_capture
                 and hasattr(event_sink, "capture_snapshot")
         ):
@@ -2275,25 +2370,15 @@ def step_tick_debug(actors: list[Actor]) -> tuple[Actor | None, list[float]]:
     This provides observability for traces/logging without changing the
     core step_tick() behavior.
     """
-    # 1) simultaneous fill
-    for a in actors:
-        eff_speed = float(a.speed) * float(a.speed_multiplier)
-        a.turn_meter += eff_speed
+    # 1-3) simultaneous fill, then highest TM / speed / list order among the ready
+    _, best = _fill_and_select_ready_actor(actors, apply_effects=False)
 
     # Snapshot AFTER fill, BEFORE any reset (this is the "winning snapshot")
     before_reset = [float(a.turn_meter) for a in actors]
 
-    # 2) find all ready actors
-    ready_indexed = [(i, a) for (i, a) in enumerate(actors) if a.turn_meter + EPS >= TM_GATE]
-    if not ready_indexed:
+    if best is None:
         return None, before_reset
 
-    # 3) choose actor: highest TM, then speed, then list order
-    _, best = max(
-        ready_indexed,
-        key=lambda t: (t[1].turn_meter, t[1].speed, -t[0]),
-    )
-
     # 4) reset TM (overflow discarded)
     best.turn_meter = 0.0
     return best, before_reset
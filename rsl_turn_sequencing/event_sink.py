@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable
 
 from rsl_turn_sequencing.events import Event, EventType
 
@@ -19,6 +19,11 @@ class EventSink(ABC):
     @abstractmethod
     def emit(self, event_type: EventType, actor: str | None = None, **data: Any) -> None: ...
 
+    def emit_many(self, events: Iterable[tuple[EventType, str | None, dict[str, Any]]]) -> None:
+        """Emit a batch of (event_type, actor, data) triples, preserving order."""
+        for event_type, actor, data in events:
+            self.emit(event_type, actor, **data)
+
     @property
     @abstractmethod
     def current_tick(self) -> int: ...
@@ -29,6 +34,10 @@ class InMemoryEventSink(EventSink):
     """
     Simple sink for tests/demos.
     Owns tick/seq numbering so the engine stays free of global state.
+
+    Alongside the ordered `events` log, the sink keeps lookup indices by event
+    type and tick. They are updated together at emit time and hold the
+    same Event objects as `events`.
     """
 
     events: list[Event] = field(default_factory=list)
@@ -36,6 +45,20 @@ class InMemoryEventSink(EventSink):
     _seq: int = field(default=0, init=False)
     snapshots: dict[tuple[int, str], dict[str, Any]] = field(default_factory=dict)
 
+    # EventType is closed, so every bucket is created up front (no per-emit misses).
+    _by_type: dict[EventType, list[Event]] = field(
+        default_factory=lambda: {t: [] for t in EventType}, init=False, repr=False, compare=False
+    )
+    _by_tick: dict[int, list[Event]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Bucket for the current tick; ticks only move forward, so emit appends here directly.
+    _tick_events: list[Event] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Index any events supplied at construction time.
+        for evt in self.events:
+            self._by_type[evt.type].append(evt)
+            self._by_tick.setdefault(evt.tick, []).append(evt)
+
     @property
     def current_tick(self) -> int:
         return self._tick
@@ -43,21 +66,53 @@ class InMemoryEventSink(EventSink):
     def start_tick(self) -> int:
         self._tick += 1
         self._seq = 0
+        self._tick_events = self._by_tick.setdefault(self._tick, [])
         return self._tick
 
     def emit(self, event_type: EventType, actor: str | None = None, **data: object) -> None:
         if self._tick <= 0:
             raise RuntimeError("EventSink.start_tick() must be called before emitting events.")
         self._seq += 1
-        self.events.append(
-            Event(
-                tick=self._tick,
-                seq=self._seq,
-                type=event_type,
-                actor=actor,
-                data=dict(data),
-            )
+        # **data is already a fresh dict owned by this call; no copy needed.
+        evt = Event(
+            tick=self._tick,
+            seq=self._seq,
+            type=event_type,
+            actor=actor,
+            data=data,
         )
+        self.events.append(evt)
+        self._by_type[event_type].append(evt)
+        self._tick_events.append(evt)
+
+    def emit_many(self, events: Iterable[tuple[EventType, str | None, dict[str, Any]]]) -> None:
+        if self._tick <= 0:
+            raise RuntimeError("EventSink.start_tick() must be called before emitting events.")
+        tick = self._tick
+        seq = self._seq
+        by_type = self._by_type
+        batch: list[Event] = []
+        for event_type, actor, data in events:
+            seq += 1
+            evt = Event(tick=tick, seq=seq, type=event_type, actor=actor, data=dict(data))
+            batch.append(evt)
+            by_type[event_type].append(evt)
+        self._seq = seq
+        self.events.extend(batch)
+        self._tick_events.extend(batch)
+
+    def by_type(self, event_type: EventType) -> list[Event]:
+        """Events of `event_type`, in emission order."""
+        return list(self._by_type[event_type])
+
+    def first_of_type(self, event_type: EventType) -> Event | None:
+        """First event of `event_type`, or None if none was emitted."""
+        bucket = self._by_type[event_type]
+        return bucket[0] if bucket else None
+
+    def by_tick(self, tick: int) -> list[Event]:
+        """Events emitted during `tick`, in emission order."""
+        return list(self._by_tick.get(tick, ()))
 
     def capture_snapshot(self, *, turn: int, phase: str, snapshot: dict[str, Any]) -> None:
         self.snapshots[(turn, phase)] = snapshot
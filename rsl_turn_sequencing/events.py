@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, unique
 from typing import Any
 
 
+@unique
 class EventType(str, Enum):
     """Minimal event vocabulary for the simulator truth engine."""
 
@@ -1,10 +1,11 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 from rsl_turn_sequencing.effects import Effect
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EffectInstance:
     """
     Minimal representation of a buff/debuff instance on an actor.
@@ -25,7 +26,7 @@ class EffectInstance:
     applied_turn: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Actor:
     name: str
     # Speed and turn meter are modeled as floating point values.
@@ -76,3 +77,19 @@ class Actor:
 
     # NEW: Buff/debuff instances currently active on this actor (for injected expiration seam).
     active_effects: list[EffectInstance] = field(default_factory=list)
+
+    # Engine-owned bookkeeping (not constructor arguments). Declared because the
+    # class uses __slots__, so ad-hoc attributes cannot be attached at runtime.
+    #   - _a1_hits: A1 hit count resolved from the battle spec (build_actors_from_battle_spec).
+    #   - _turn_counter: per-battle turn counter when step_tick runs without an event sink.
+    #   - _current_turn_counter: turn counter stamped on every actor for provider helpers.
+    _a1_hits: int = field(default=1, init=False, repr=False, compare=False)
+    _turn_counter: int = field(default=0, init=False, repr=False, compare=False)
+    _current_turn_counter: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Names are compared against literals and spec strings on every turn
+        # (join attacks, skill buffs, proc requests); interning makes equal
+        # names the same object so those compares short-circuit on identity.
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
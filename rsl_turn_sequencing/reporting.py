@@ -40,12 +40,12 @@ def _shield_from_event(e: Event) -> ShieldSnapshot | None:
     """
     Extract a ShieldSnapshot from an event payload, if present.
     """
-    if "boss_shield_value" not in e.data or "boss_shield_status" not in e.data:
+    data = e.data
+    value = data.get("boss_shield_value")
+    status = data.get("boss_shield_status")
+    if value is None or status is None:
         return None
-    return ShieldSnapshot(
-        value=int(e.data["boss_shield_value"]),
-        status=str(e.data["boss_shield_status"]),
-    )
+    return ShieldSnapshot(value=int(value), status=str(status))
 
 
 def derive_turn_rows(events: Iterable[Event]) -> list[TurnRow]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from typing import Any
 
 from rsl_turn_sequencing.event_sink import EventSink
 from rsl_turn_sequencing.events import EventType
@@ -23,6 +24,9 @@ def apply_skill_buffs(
       - Slice 2: Mikage Base A3 (B_A3): place Increase ATK and Increase C.DMG on all allies for 2 turns.
       - Slice 7: Mikage Base A2 (B_A2): increase ally BUFF durations by +1 (and emit duration-change events).
       - Fire Knight shield-state sample: Martyr A2 (A2): place Increase DEF on all allies for 2 turns.
+
+    Events for a single skill are collected locally and flushed to the sink in
+    one emit_many() call, preserving their per-instance order.
     """
     if not skill_id:
         return
@@ -43,9 +47,16 @@ def apply_skill_buffs(
     # Engine stamps this each time a turn is processed (even without an event sink).
     applied_turn = int(getattr(actor, "_current_turn_counter", 0))
 
+    # Instance ids are "fx_<holder>_<skill>_<seq_index>_<target>_<effect_id>"; the
+    # first four fields are fixed for this call, so format them once.
+    id_prefix = f"fx_{holder}_{s}_{seq_index}_"
+
     # Allies: this simulator currently models a single allied team vs a boss.
     allies: list[Actor] = [a for a in actors if not getattr(a, "is_boss", False)]
 
+    # Pending (event_type, actor, data) triples, flushed once per skill.
+    pending: list[tuple[EventType, str | None, dict[str, Any]]] = []
+
     # --- Martyr ---
     # Fire Knight shield-state sample: Martyr's opening buff is modeled as A2 in the narrated spec.
     # We materialize the minimal BUFF state needed for shield-hit contributors:
@@ -54,7 +65,7 @@ def apply_skill_buffs(
     if holder_l == "martyr" and s == "A2":
         for target in allies:
             for effect_id in ("increase_def", "counterattack"):
-                instance_id = f"fx_{holder}_{s}_{seq_index}_{target.name}_{effect_id}"
+                instance_id = id_prefix + target.name + "_" + effect_id
                 inst = EffectInstance(
                     instance_id=instance_id,
                     effect_id=effect_id,
@@ -66,31 +77,37 @@ def apply_skill_buffs(
                 target.active_effects.append(inst)
 
                 if event_sink is not None:
-                    event_sink.emit(
+                    pending.append((
                         EventType.EFFECT_APPLIED,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        source_skill_id=s,
-                        source_sequence_index=seq_index,
-                    )
-
-                    event_sink.emit(
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            source_skill_id=s,
+                            source_sequence_index=seq_index,
+                        ),
+                    ))
+
+                    pending.append((
                         EventType.EFFECT_DURATION_SET,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        reason="initial_application",
-                        boundary="placement",
-                    )
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            reason="initial_application",
+                            boundary="placement",
+                        ),
+                    ))
+        if event_sink is not None and pending:
+            event_sink.emit_many(pending)
         return
 
 
@@ -100,7 +117,7 @@ def apply_skill_buffs(
     if holder_l == "mithrala" and s == "A3":
         for target in allies:
             for effect_id in ("strengthen", "shield"):
-                instance_id = f"fx_{holder}_{s}_{seq_index}_{target.name}_{effect_id}"
+                instance_id = id_prefix + target.name + "_" + effect_id
                 inst = EffectInstance(
                     instance_id=instance_id,
                     effect_id=effect_id,
@@ -112,31 +129,37 @@ def apply_skill_buffs(
                 target.active_effects.append(inst)
 
                 if event_sink is not None:
-                    event_sink.emit(
+                    pending.append((
                         EventType.EFFECT_APPLIED,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        reason=s,
-                        boundary="placement",
-                    )
-
-                    event_sink.emit(
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            reason=s,
+                            boundary="placement",
+                        ),
+                    ))
+
+                    pending.append((
                         EventType.EFFECT_DURATION_SET,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        reason="initial_application",
-                        boundary="placement",
-                    )
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            reason="initial_application",
+                            boundary="placement",
+                        ),
+                    ))
+        if event_sink is not None and pending:
+            event_sink.emit_many(pending)
         return
 
     # --- Mikage ---
@@ -148,7 +171,7 @@ def apply_skill_buffs(
     if s == "B_A3":
         for target in allies:
             for effect_id in ("increase_atk", "increase_c_dmg"):
-                instance_id = f"fx_{holder}_{s}_{seq_index}_{target.name}_{effect_id}"
+                instance_id = id_prefix + target.name + "_" + effect_id
                 inst = EffectInstance(
                     instance_id=instance_id,
                     effect_id=effect_id,
@@ -160,38 +183,44 @@ def apply_skill_buffs(
                 target.active_effects.append(inst)
 
                 if event_sink is not None:
-                    event_sink.emit(
+                    pending.append((
                         EventType.EFFECT_APPLIED,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        source_skill_id=s,
-                        source_sequence_index=seq_index,
-                    )
-
-                    event_sink.emit(
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            source_skill_id=s,
+                            source_sequence_index=seq_index,
+                        ),
+                    ))
+
+                    pending.append((
                         EventType.EFFECT_DURATION_SET,
-                        actor=holder,
-                        instance_id=inst.instance_id,
-                        effect_id=inst.effect_id,
-                        effect_kind=inst.effect_kind,
-                        owner=target.name,
-                        placed_by=inst.placed_by,
-                        duration=inst.duration,
-                        reason="initial_application",
-                        boundary="placement",
-                    )
+                        holder,
+                        dict(
+                            instance_id=inst.instance_id,
+                            effect_id=inst.effect_id,
+                            effect_kind=inst.effect_kind,
+                            owner=target.name,
+                            placed_by=inst.placed_by,
+                            duration=inst.duration,
+                            reason="initial_application",
+                            boundary="placement",
+                        ),
+                    ))
+        if event_sink is not None and pending:
+            event_sink.emit_many(pending)
         return
 
     # Slice 7: Mikage Base A2 -> increase ally BUFF durations by +1.
     if s == "B_A2":
         for target in allies:
             # Replace instances in-place (EffectInstance is frozen).
-            for i, fx in enumerate(list(target.active_effects)):
+            for i, fx in enumerate(target.active_effects):
                 if fx.effect_kind != "BUFF":
                     continue
 
@@ -200,21 +229,25 @@ def apply_skill_buffs(
                 target.active_effects[i] = replace(fx, duration=new)
 
                 if event_sink is not None:
-                    event_sink.emit(
+                    pending.append((
                         EventType.EFFECT_DURATION_CHANGED,
-                        actor=holder,
-                        instance_id=fx.instance_id,
-                        effect_id=fx.effect_id,
-                        effect_kind=fx.effect_kind,
-                        owner=target.name,
-                        placed_by=fx.placed_by,
-                        old_duration=old,
-                        new_duration=new,
-                        delta=1,
-                        reason="B_A2",
-                        source_skill_id=s,
-                        source_sequence_index=seq_index,
-                    )
+                        holder,
+                        dict(
+                            instance_id=fx.instance_id,
+                            effect_id=fx.effect_id,
+                            effect_kind=fx.effect_kind,
+                            owner=target.name,
+                            placed_by=fx.placed_by,
+                            old_duration=old,
+                            new_duration=new,
+                            delta=1,
+                            reason="B_A2",
+                            source_skill_id=s,
+                            source_sequence_index=seq_index,
+                        ),
+                    ))
+        if event_sink is not None and pending:
+            event_sink.emit_many(pending)
         return
 
     # Other Mikage skills are currently out of provider scope.
@@ -95,8 +95,8 @@ def run_ticks_with_trace(actors: list[Actor], num_ticks: int) -> list[TickTrace]
         winner = step_tick(actors, event_sink=sink)
         tick = sink.current_tick
 
-        tick_events = [e for e in sink.events if e.tick == tick]
-        fill_evt = next((e for e in tick_events if e.type == EventType.FILL_COMPLETE), None)
+        tick_events = sink.by_tick(tick)
+        fill_evt = next((e for e in tick_events if e.type is EventType.FILL_COMPLETE), None)
         if fill_evt is not None and "meters" in fill_evt.data:
             before_reset = [float(m["turn_meter"]) for m in fill_evt.data["meters"]]
         else:
@@ -0,0 +1,44 @@
+# tests/_support/actors.py
+from __future__ import annotations
+
+import copy
+
+from rsl_turn_sequencing.models import Actor
+
+MIKAGE_TEMPLATE = Actor(name="Mikage", speed=100.0)
+COLDHEART_TEMPLATE = Actor(name="Coldheart", speed=0.0)
+
+# The six-actor roster from the Tick sheet (TM gate 1430.0).
+TICK_SHEET_TEMPLATES: tuple[Actor, ...] = (
+    Actor("Mikage", 340.0),
+    Actor("Mithrala", 282.0),
+    Actor("Tomblord", 270.0),
+    Actor("Coldheart", 265.0),
+    Actor("Martyr", 252.0),
+    Actor("Boss", 250.0),
+)
+
+
+def fresh_actor(template: Actor) -> Actor:
+    """
+    Shallow-copy an Actor template, giving the copy its own mutable containers.
+
+    Scalars (name, speed, meters, cursors) are taken from the template as-is.
+    """
+    a = copy.copy(template)
+    a.effects = list(template.effects)
+    a.active_effects = list(template.active_effects)
+    a.blessings = {k: dict(v) for k, v in template.blessings.items()}
+    if template.skill_sequence is not None:
+        a.skill_sequence = list(template.skill_sequence)
+    return a
+
+
+def fresh_mikage_and_ally() -> tuple[Actor, Actor]:
+    """(Mikage @ 100 SPD, Coldheart @ 0 SPD), as used by the rapid response / slice 5 tests."""
+    return fresh_actor(MIKAGE_TEMPLATE), fresh_actor(COLDHEART_TEMPLATE)
+
+
+def make_tick_sheet_actors() -> list[Actor]:
+    """Fresh copies of the Tick sheet roster (speeds 340/282/270/265/252/250)."""
+    return [fresh_actor(t) for t in TICK_SHEET_TEMPLATES]
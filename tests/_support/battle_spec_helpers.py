@@ -71,3 +71,22 @@ def add_mastery_proc_request(
         step_obj["mastery_procs"] = mastery_procs
 
     mastery_procs.append({"holder": holder, "mastery": mastery, "count": count})
+
+
+def add_mastery_proc_request_by_name(
+    battle_spec: MutableMapping[str, Any],
+    *,
+    champion_name: str,
+    step: int,
+    holder: str,
+    mastery: str,
+    count: int,
+) -> None:
+    """Add a mastery proc request to the champion named `champion_name` (see add_mastery_proc_request)."""
+    add_mastery_proc_request(
+        find_champion(battle_spec, name=champion_name),
+        step=step,
+        holder=holder,
+        mastery=mastery,
+        count=count,
+    )
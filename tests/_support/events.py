@@ -0,0 +1,18 @@
+# tests/_support/events.py
+from __future__ import annotations
+
+from typing import Sequence
+
+from rsl_turn_sequencing.events import Event, EventType
+
+
+def last_of_type(events: Sequence[Event], event_type: EventType) -> Event:
+    """
+    Return the most recent event of the given type, scanning from the end.
+
+    Raises AssertionError if no such event exists.
+    """
+    for e in reversed(events):
+        if e.type is event_type:
+            return e
+    raise AssertionError(f"No {event_type.value} event found")
@@ -0,0 +1,17 @@
+# tests/_support/tick.py
+from __future__ import annotations
+
+from typing import Any
+
+from rsl_turn_sequencing.engine import step_tick
+from rsl_turn_sequencing.models import Actor
+
+
+def step_ticks(actors: list[Actor], n: int, **kwargs: Any) -> Actor | None:
+    """
+    Call step_tick(actors, **kwargs) n times; return the last tick's winner (or None).
+    """
+    last: Actor | None = None
+    for _ in range(n):
+        last = step_tick(actors, **kwargs)
+    return last
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from typing import Any, Callable
+
+import pytest
+
+from rsl_turn_sequencing.engine import MasteryProcRequester, build_mastery_proc_requester_from_battle_path
+from rsl_turn_sequencing.event_sink import InMemoryEventSink
+
+
+@pytest.fixture(scope="session")
+def make_requester(tmp_path_factory) -> Callable[[dict[str, Any]], MasteryProcRequester | None]:
+    """
+    Build a mastery proc requester from a battle spec dict, memoized by content.
+
+    Each distinct spec is written to disk once and parsed via
+    build_mastery_proc_requester_from_battle_path, so tests still exercise the
+    JSON path. The tests never mutate requesters, so identical specs share one
+    instance; this is the only requester cache (the engine builds fresh each call).
+    """
+    spec_dir = tmp_path_factory.mktemp("specs")
+
+    @functools.lru_cache(maxsize=64)
+    def _build(key: str) -> MasteryProcRequester | None:
+        path = spec_dir / f"battle_spec_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json"
+        path.write_text(key, encoding="utf-8")
+        return build_mastery_proc_requester_from_battle_path(path)
+
+    def make(battle_spec: dict[str, Any]) -> MasteryProcRequester | None:
+        return _build(json.dumps(battle_spec, sort_keys=True, separators=(",", ":")))
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def empty_requester(make_requester) -> MasteryProcRequester | None:
+    """
+    Requester for a Mikage + Coldheart battle spec that declares no proc requests.
+
+    Shared across the session; the spec is never mutated by the tests that use it.
+    """
+    return make_requester(
+        {
+            "boss": {"name": "Boss", "speed": 1500},
+            "champions": [
+                {"slot": 1, "name": "Mikage", "speed": 100.0},
+                {"slot": 2, "name": "Coldheart", "speed": 0.0},
+            ],
+            "options": {"sequence_policy": "error_if_exhausted"},
+        }
+    )
+
+
+@pytest.fixture
+def sink() -> InMemoryEventSink:
+    """
+    A fresh in-memory event sink per test.
+
+    Not shared across tests: the engine keeps per-battle state on the sink
+    (turn_counter, qualifying expiration counts, resolved proc keys).
+    """
+    return InMemoryEventSink()
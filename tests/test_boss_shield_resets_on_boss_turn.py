@@ -24,7 +24,7 @@ def test_boss_shield_resets_to_full_at_boss_turn_start() -> None:
             (
                 e
                 for e in tick_events
-                if e.type == EventType.TURN_START and e.actor == "Boss"
+                if e.type is EventType.TURN_START and e.actor == "Boss"
             ),
             None,
         )
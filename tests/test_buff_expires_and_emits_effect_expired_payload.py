@@ -39,13 +39,11 @@ def test_slice4_buff_owner_turn_end_expires_zero_duration_buff_and_emits_payload
     assert mikage.active_effects == []
 
     # Assert: EFFECT_EXPIRED contains structured payload.
-    expired = [e for e in sink.events if e.type == EventType.EFFECT_EXPIRED]
+    expired = sink.by_type(EventType.EFFECT_EXPIRED)
     assert expired, "Expected at least one EFFECT_EXPIRED event."
 
-    matching = [
-        e
-        for e in expired
-        if e.data.get("instance_id") == "fx_mikage_self_01"
+    matching = any(
+        e.data.get("instance_id") == "fx_mikage_self_01"
         and e.data.get("effect_id") == "increase_atk"
         and e.data.get("effect_kind") == "BUFF"
         and e.data.get("owner") == "Mikage"
@@ -53,7 +51,8 @@ def test_slice4_buff_owner_turn_end_expires_zero_duration_buff_and_emits_payload
         and e.data.get("duration") == 1
         and e.data.get("reason") == "duration_reached_zero"
         and e.data.get("phase") == str(EventType.TURN_END)
-    ]
+        for e in expired
+    )
 
     assert matching, (
         "Expected EFFECT_EXPIRED event with required payload: "
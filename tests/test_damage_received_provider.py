@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from rsl_turn_sequencing.engine import build_damage_received_provider_from_battle_path
+
+
+def _write_spec(tmp_path: Path, spec: object) -> Path:
+    battle_path = tmp_path / "battle_spec.json"
+    battle_path.write_text(json.dumps(spec, separators=(",", ":")), encoding="utf-8")
+    return battle_path
+
+
+def test_damage_received_provider_builds_from_minimal_spec_without_overrides(tmp_path: Path) -> None:
+    battle_path = _write_spec(tmp_path, {"boss": {"name": "Boss"}, "champions": []})
+
+    provider = build_damage_received_provider_from_battle_path(battle_path)
+
+    assert provider is not None, "Expected a provider even when no damage_received overrides are declared."
+    assert provider.steps() == []
+    assert provider({"champion_name": "Boss", "skill_sequence_step": 1}) is None
+
+
+def test_damage_received_provider_reads_boss_on_step_overrides(tmp_path: Path) -> None:
+    spec = {
+        "boss": {
+            "name": "Boss",
+            "turn_overrides": {"damage_received": {"on_step": {"2": {"damaged": ["Mikage"]}}}},
+        },
+        "champions": [{"name": "Mikage"}],
+    }
+    battle_path = _write_spec(tmp_path, spec)
+
+    provider = build_damage_received_provider_from_battle_path(battle_path)
+
+    assert provider is not None
+    assert provider.steps(champion_name="Boss") == [2]
+    assert provider({"champion_name": "Boss", "skill_sequence_step": 2}) == ["Mikage"]
+    assert provider({"champion_name": "Boss", "skill_sequence_step": 1}) is None
+
+
+def test_damage_received_provider_rejects_non_object_spec(tmp_path: Path) -> None:
+    battle_path = _write_spec(tmp_path, [])
+
+    assert build_damage_received_provider_from_battle_path(battle_path) is None
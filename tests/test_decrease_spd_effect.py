@@ -2,18 +2,7 @@ from rsl_turn_sequencing.effects import Effect, EffectKind
 from rsl_turn_sequencing.engine import step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
-from rsl_turn_sequencing.models import Actor
-
-
-def make_actors():
-    return [
-        Actor("Mikage", 340.0),
-        Actor("Mithrala", 282.0),
-        Actor("Tomblord", 270.0),
-        Actor("Coldheart", 265.0),
-        Actor("Martyr", 252.0),
-        Actor("Boss", 250.0),
-    ]
+from tests._support.actors import make_tick_sheet_actors
 
 
 def test_decrease_spd_duration_1_applies_and_expires_at_turn_end():
@@ -24,7 +13,7 @@ def test_decrease_spd_duration_1_applies_and_expires_at_turn_end():
       - duration=1 expires after exactly one of that actor's turns completes.
       - TURN_START / TURN_END are bookmarks; end-of-turn expirations are emitted BEFORE TURN_END.
     """
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
     sink = InMemoryEventSink()
 
     # Apply Decrease SPD (1) to Mikage before any ticks.
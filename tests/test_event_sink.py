@@ -1,18 +1,7 @@
 from rsl_turn_sequencing.engine import step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
-from rsl_turn_sequencing.models import Actor
-
-
-def make_actors():
-    return [
-        Actor("Mikage", 340.0),
-        Actor("Mithrala", 282.0),
-        Actor("Tomblord", 270.0),
-        Actor("Coldheart", 265.0),
-        Actor("Martyr", 252.0),
-        Actor("Boss", 250.0),
-    ]
+from tests._support.actors import make_tick_sheet_actors
 
 
 def test_event_order_on_first_action_tick():
@@ -23,7 +12,7 @@ def test_event_order_on_first_action_tick():
           TICK_START -> FILL_COMPLETE -> WINNER_SELECTED -> RESET_APPLIED -> TURN_START -> TURN_END
       - Winner is Mikage on that first action tick.
     """
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
     sink = InMemoryEventSink()
 
     # Run through tick 5 (tick numbering owned by sink.start_tick()).
@@ -53,12 +42,12 @@ def test_event_order_on_first_action_tick():
 
 
 def test_event_stream_is_deterministic_over_n_ticks():
-    actors1 = make_actors()
+    actors1 = make_tick_sheet_actors()
     sink1 = InMemoryEventSink()
     for _ in range(25):
         step_tick(actors1, event_sink=sink1)
 
-    actors2 = make_actors()
+    actors2 = make_tick_sheet_actors()
     sink2 = InMemoryEventSink()
     for _ in range(25):
         step_tick(actors2, event_sink=sink2)
@@ -67,7 +56,7 @@ def test_event_stream_is_deterministic_over_n_ticks():
 
 
 def test_step_tick_emits_no_stdout_or_stderr(capsys):
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
     sink = InMemoryEventSink()
 
     for _ in range(10):
@@ -76,3 +65,37 @@ def test_step_tick_emits_no_stdout_or_stderr(capsys):
     captured = capsys.readouterr()
     assert captured.out == ""
     assert captured.err == ""
+
+
+def test_emit_many_matches_sequential_emit():
+    batch = [
+        (EventType.EFFECT_APPLIED, "Mikage", {"instance_id": "fx_1"}),
+        (EventType.EFFECT_DURATION_SET, "Mikage", {"instance_id": "fx_1", "duration": 2}),
+    ]
+
+    batched = InMemoryEventSink()
+    batched.start_tick()
+    batched.emit(EventType.TICK_START)
+    batched.emit_many(batch)
+
+    sequential = InMemoryEventSink()
+    sequential.start_tick()
+    sequential.emit(EventType.TICK_START)
+    for event_type, actor, data in batch:
+        sequential.emit(event_type, actor, **data)
+
+    assert batched.events == sequential.events
+    assert [e.seq for e in batched.events] == [1, 2, 3]
+
+
+def test_sink_indices_agree_with_event_log():
+    actors = make_tick_sheet_actors()
+    sink = InMemoryEventSink()
+    for _ in range(10):
+        step_tick(actors, event_sink=sink)
+
+    for tick in range(1, 11):
+        assert sink.by_tick(tick) == [e for e in sink.events if e.tick == tick]
+    for t in EventType:
+        assert sink.by_type(t) == [e for e in sink.events if e.type is t]
+        assert sink.first_of_type(t) == next((e for e in sink.events if e.type is t), None)
@@ -104,7 +104,7 @@ def test_composite_mikage_a3_teamups_plus_phantom_touch() -> None:
     mikage_turn_end = next(
         e
         for e in reversed(sink.events)
-        if e.type == EventType.TURN_END and e.actor == mikage["name"]
+        if e.type is EventType.TURN_END and e.actor == mikage["name"]
     )
 
     assert mikage_turn_end.data["boss_shield_value"] == shield_start - expected_total_hits
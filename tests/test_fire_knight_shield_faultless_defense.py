@@ -59,7 +59,7 @@ def test_faultless_defense_reflect_causes_single_shield_hit() -> None:
     boss_turn_end = next(
         e
         for e in reversed(sink.events)
-        if e.type == EventType.TURN_END and e.actor == boss.name
+        if e.type is EventType.TURN_END and e.actor == boss.name
     )
 
     assert boss_turn_end.data["boss_shield_value"] == shield_start - 1
@@ -97,7 +97,7 @@ def test_mikage_a3_teamups_resolve_in_canonical_slot_order() -> None:
     mikage_turn_end = next(
         e
         for e in reversed(sink.events)
-        if e.type == EventType.TURN_END and e.actor == mikage["name"]
+        if e.type is EventType.TURN_END and e.actor == mikage["name"]
     )
 
     assert mikage_turn_end.data["boss_shield_value"] == shield_start - expected_total_hits
@@ -47,7 +47,7 @@ def test_shield_decrements_by_multihit_count_from_committed_dataset() -> None:
     ch_turn_end = next(
         e
         for e in reversed(sink.events)
-        if e.type == EventType.TURN_END and e.actor == ch.name
+        if e.type is EventType.TURN_END and e.actor == ch.name
     )
     assert ch_turn_end.data["boss_shield_value"] == shield_start - hits
     assert ch_turn_end.data["boss_shield_status"] == "UP"
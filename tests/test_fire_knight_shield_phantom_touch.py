@@ -69,7 +69,7 @@ def test_phantom_touch_adds_one_extra_shield_hit() -> None:
     ch_turn_end = next(
         e
         for e in reversed(sink.events)
-        if e.type == EventType.TURN_END and e.actor == ch.name
+        if e.type is EventType.TURN_END and e.actor == ch.name
     )
 
     assert ch_turn_end.data["boss_shield_value"] == shield_start - (base_hits + 1)
@@ -11,23 +11,22 @@ Failure surface (Option B):
 """
 
 import json
-import tempfile
 from pathlib import Path
 
 from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester_from_battle_path, step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
-from tests._support.battle_spec_helpers import add_mastery_proc_request, find_champion
+from tests._support.battle_spec_helpers import add_mastery_proc_request_by_name
 
 
 def _write_battle_spec(tmpdir: Path, battle_spec: dict) -> Path:
     path = tmpdir / "battle_spec_sliceB.json"
-    path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(battle_spec, separators=(",", ":")), encoding="utf-8")
     return path
 
 
-def test_sliceB_mismatch_requested_count_emits_mastery_proc_rejected() -> None:
+def test_sliceB_mismatch_requested_count_emits_mastery_proc_rejected(tmp_path: Path) -> None:
     mikage = Actor(name="Mikage", speed=100.0)
     ally = Actor(name="Coldheart", speed=0.0)
 
@@ -58,53 +57,51 @@ def test_sliceB_mismatch_requested_count_emits_mastery_proc_rejected() -> None:
         "options": {"sequence_policy": "error_if_exhausted"},
     }
 
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-    add_mastery_proc_request(
-        mikage_spec,
+    add_mastery_proc_request_by_name(
+        battle_spec,
+        champion_name="Mikage",
         step=1,
         holder="Mikage",
         mastery="rapid_response",
         count=2,  # mismatch: Q will be 1
     )
 
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
-        assert mastery_proc_requester is not None
+    battle_path = _write_battle_spec(tmp_path, battle_spec)
+    mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
+    assert mastery_proc_requester is not None
 
-        sink = InMemoryEventSink()
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=mastery_proc_requester,
-        )
+    sink = InMemoryEventSink()
+    step_tick(
+        [mikage, ally],
+        event_sink=sink,
+        mastery_proc_requester=mastery_proc_requester,
+    )
 
     # Assert: no proc was emitted.
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
+    procs = sink.by_type(EventType.MASTERY_PROC)
     assert procs == [], "Expected no MASTERY_PROC when request count mismatches Q."
 
     # Assert: rejection event emitted with deterministic payload.
-    rejected = [e for e in sink.events if e.type == EventType.MASTERY_PROC_REJECTED]
+    rejected = sink.by_type(EventType.MASTERY_PROC_REJECTED)
     assert rejected, "Expected MASTERY_PROC_REJECTED when request count mismatches Q."
 
-    matching = [
-        e
-        for e in rejected
-        if e.data.get("holder") == "Mikage"
+    matching = any(
+        e.data.get("holder") == "Mikage"
         and e.data.get("mastery") == "rapid_response"
         and e.data.get("requested_count") == 2
         and e.data.get("qualifying_count") == 1
         and e.data.get("skill_sequence_step") == 1
         and e.data.get("turn_counter") == 1
         and e.data.get("reason") == "requested_count_mismatch"
-    ]
+        for e in rejected
+    )
     assert matching, "Expected rejection payload to include holder/mastery/requested_count/qualifying_count/step."
 
     # Ordering: the expiration should precede the rejection for this step.
     idx_expired = next(
         i
         for i, e in enumerate(sink.events)
-        if e.type == EventType.EFFECT_EXPIRED and e.data.get("instance_id") == "fx_mikage_self_mismatch_01"
+        if e.type is EventType.EFFECT_EXPIRED and e.data.get("instance_id") == "fx_mikage_self_mismatch_01"
     )
-    idx_rejected = next(i for i, e in enumerate(sink.events) if e.type == EventType.MASTERY_PROC_REJECTED)
+    idx_rejected = next(i for i, e in enumerate(sink.events) if e.type is EventType.MASTERY_PROC_REJECTED)
     assert idx_expired < idx_rejected
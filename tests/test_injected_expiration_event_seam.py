@@ -3,6 +3,9 @@ from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
 
+_PHASE_TURN_START = str(EventType.TURN_START)
+_PHASE_TURN_END = str(EventType.TURN_END)
+
 
 def test_can_inject_expire_effect_before_turn_start_within_turn_boundary() -> None:
     """
@@ -34,7 +37,7 @@ def test_can_inject_expire_effect_before_turn_start_within_turn_boundary() -> No
 
     def injector(ctx: dict) -> list[dict]:
         if (
-            ctx.get("phase") == str(EventType.TURN_START)
+            ctx.get("phase") == _PHASE_TURN_START
             and ctx.get("acting_actor") == "Mikage"
             and ctx.get("turn_counter") == 1
         ):
@@ -54,16 +57,15 @@ def test_can_inject_expire_effect_before_turn_start_within_turn_boundary() -> No
 
     injected = [
         e
-        for e in sink.events
-        if e.type == EventType.EFFECT_EXPIRED
-        and e.actor == "Mikage"
+        for e in sink.by_type(EventType.EFFECT_EXPIRED)
+        if e.actor == "Mikage"
         and e.data.get("instance_id") == "fx_test_01"
         and e.data.get("effect_id") == "test_buff"
         and e.data.get("effect_kind") == "BUFF"
         and e.data.get("owner") == "Mikage"
         and e.data.get("placed_by") == "Mikage"
         and e.data.get("reason") == "injected"
-        and e.data.get("phase") == str(EventType.TURN_START)
+        and e.data.get("phase") == _PHASE_TURN_START
         and e.data.get("injected_turn_counter") == 1
     ]
     assert injected, "Expected structured EFFECT_EXPIRED before TURN_START on turn 1."
@@ -96,14 +98,14 @@ def test_injector_supports_extra_turn_boundaries_without_advancing_tick() -> Non
         if (
             ctx.get("acting_actor") == "Mikage"
             and ctx.get("turn_counter") == 2
-            and ctx.get("phase") == str(EventType.TURN_START)
+            and ctx.get("phase") == _PHASE_TURN_START
         ):
             return [{"type": "expire_effect", "instance_id": "fx_extra_start", "reason": "injected"}]
 
         if (
             ctx.get("acting_actor") == "Mikage"
             and ctx.get("turn_counter") == 2
-            and ctx.get("phase") == str(EventType.TURN_END)
+            and ctx.get("phase") == _PHASE_TURN_END
         ):
             return [{"type": "expire_effect", "instance_id": "fx_extra_end", "reason": "injected"}]
 
@@ -126,11 +128,10 @@ def test_injector_supports_extra_turn_boundaries_without_advancing_tick() -> Non
 
     injected_start = [
         e
-        for e in sink.events
-        if e.type == EventType.EFFECT_EXPIRED
-        and e.actor == "Mikage"
+        for e in sink.by_type(EventType.EFFECT_EXPIRED)
+        if e.actor == "Mikage"
         and e.data.get("instance_id") == "fx_extra_start"
-        and e.data.get("phase") == str(EventType.TURN_START)
+        and e.data.get("phase") == _PHASE_TURN_START
         and e.data.get("injected_turn_counter") == 2
         and e.tick == tick_after_normal
     ]
@@ -138,11 +139,10 @@ def test_injector_supports_extra_turn_boundaries_without_advancing_tick() -> Non
 
     injected_end = [
         e
-        for e in sink.events
-        if e.type == EventType.EFFECT_EXPIRED
-        and e.actor == "Mikage"
+        for e in sink.by_type(EventType.EFFECT_EXPIRED)
+        if e.actor == "Mikage"
         and e.data.get("instance_id") == "fx_extra_end"
-        and e.data.get("phase") == str(EventType.TURN_END)
+        and e.data.get("phase") == _PHASE_TURN_END
         and e.data.get("injected_turn_counter") == 2
         and e.tick == tick_after_normal
     ]
@@ -5,6 +5,8 @@ from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
 
+_PHASE_TURN_START = str(EventType.TURN_START)
+
 
 def test_injected_expire_effect_by_instance_id_removes_buff_and_emits_payload() -> None:
     """Slice: injected "expire effect by instance_id" removes a BUFF instance and emits EFFECT_EXPIRED
@@ -45,7 +47,7 @@ def test_injected_expire_effect_by_instance_id_removes_buff_and_emits_payload()
     def injector(ctx: dict) -> list[dict]:
         # Inject at the start of Mikage's first turn boundary.
         if (
-            ctx.get("phase") == str(EventType.TURN_START)
+            ctx.get("phase") == _PHASE_TURN_START
             and ctx.get("acting_actor") == "Mikage"
             and ctx.get("turn_counter") == 1
         ):
@@ -65,21 +67,20 @@ def test_injected_expire_effect_by_instance_id_removes_buff_and_emits_payload()
     assert getattr(coldheart, "active_effects") == []
 
     # Assert: EFFECT_EXPIRED payload includes placed_by + reason
-    expired = [e for e in sink.events if e.type == EventType.EFFECT_EXPIRED]
+    expired = sink.by_type(EventType.EFFECT_EXPIRED)
     assert expired, "Expected at least one EFFECT_EXPIRED event."
 
     # Find the one corresponding to the instance.
-    matching = [
-        e
-        for e in expired
-        if e.data.get("instance_id") == "fx_mikage_shield_01"
+    matching = any(
+        e.data.get("instance_id") == "fx_mikage_shield_01"
         and e.data.get("effect_id") == "shield"
         and e.data.get("effect_kind") == "BUFF"
         and e.data.get("owner") == "Coldheart"
         and e.data.get("placed_by") == "Mikage"
         and e.data.get("duration") == 2
         and e.data.get("reason") == "injected"
-    ]
+        for e in expired
+    )
 
     assert matching, (
         "Expected EFFECT_EXPIRED event with required payload: "
@@ -4,7 +4,10 @@ import json
 import tempfile
 from pathlib import Path
 
-from rsl_turn_sequencing.engine import build_mastery_proc_requester_from_battle_path
+from rsl_turn_sequencing.engine import (
+    build_mastery_proc_requester,
+    build_mastery_proc_requester_from_battle_path,
+)
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -127,3 +130,59 @@ def test_mastery_proc_requester_is_returned_even_when_no_proc_requests_exist() -
     assert requester.steps() == []  # type: ignore[attr-defined]
     assert requester.mastery_procs_for_step(1) == []  # type: ignore[attr-defined]
     assert requester({"turn_counter": 1}) == []
+
+
+def test_mastery_proc_requesters_are_independent_for_identical_spec_contents(tmp_path: Path) -> None:
+    """Each build returns its own requester, so state set on one never leaks into another."""
+    spec = _load_demo_battle_spec()
+    body = json.dumps(spec, indent=2)
+
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    a.write_text(body, encoding="utf-8")
+    b.write_text(body, encoding="utf-8")
+
+    requester_a = build_mastery_proc_requester_from_battle_path(a)
+    requester_b = build_mastery_proc_requester_from_battle_path(b)
+    assert requester_a is not None and requester_b is not None
+    assert requester_a is not requester_b
+    assert requester_a.steps() == requester_b.steps()  # type: ignore[attr-defined]
+
+    requester_a.emit_on_turn_start = False  # type: ignore[attr-defined]
+    assert requester_b.emit_on_turn_start is True  # type: ignore[attr-defined]
+
+
+def test_mastery_proc_requester_from_dict_matches_battle_path_builder(tmp_path: Path) -> None:
+    """The in-memory builder exposes the same schedule as the JSON-path builder."""
+    spec = _load_demo_battle_spec()
+    expected_step, expected_procs = _extract_expected_demo_mikage_proc_requests(spec)
+
+    battle_path = tmp_path / "demo_battle_spec.json"
+    battle_path.write_text(json.dumps(spec), encoding="utf-8")
+    from_path = build_mastery_proc_requester_from_battle_path(battle_path)
+    from_dict = build_mastery_proc_requester(spec)
+
+    assert from_path is not None and from_dict is not None
+    assert from_dict.steps() == from_path.steps()
+    assert from_dict.mastery_procs_for_step(expected_step) == from_path.mastery_procs_for_step(expected_step)
+
+    # Later edits to the caller's spec do not leak into the built requester.
+    expected_procs[0]["count"] = -1
+    assert from_dict.mastery_procs_for_step(expected_step) == from_path.mastery_procs_for_step(expected_step)
+
+    assert build_mastery_proc_requester([]) is None
+
+
+def test_mastery_proc_requester_returns_copies_of_its_schedule() -> None:
+    """Mutating a returned proc list or dict does not change what later calls return."""
+    spec = _load_demo_battle_spec()
+    expected_step, _ = _extract_expected_demo_mikage_proc_requests(spec)
+    requester = build_mastery_proc_requester(spec)
+    assert requester is not None
+
+    before = requester.mastery_procs_for_step(expected_step)  # type: ignore[attr-defined]
+    got = requester({"turn_counter": expected_step})
+    got[0]["count"] = -1
+    got.append({"holder": "X", "mastery": "y", "count": 1})
+
+    assert requester.mastery_procs_for_step(expected_step) == before  # type: ignore[attr-defined]
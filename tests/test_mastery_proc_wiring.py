@@ -93,7 +93,7 @@ def test_cli_integration_user_proc_request_emits_mastery_proc_on_engine_buff_exp
             "options": {"sequence_policy": "error_if_exhausted"},
         }
 
-        battle_path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
+        battle_path.write_text(json.dumps(battle_spec, separators=(",", ":")), encoding="utf-8")
 
         # Proposed CLI integration surface for event dump:
         p = _run_module(
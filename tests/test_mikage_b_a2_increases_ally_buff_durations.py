@@ -36,8 +36,8 @@ def test_slice7_mikage_b_a2_increases_ally_buff_durations_by_1() -> None:
         event_sink=sink,
     )
 
-    assert [fx.duration for fx in mikage.active_effects] == [2, 2]
-    assert [fx.duration for fx in ally.active_effects] == [2, 2]
+    assert len(mikage.active_effects) == 2 and all(fx.duration == 2 for fx in mikage.active_effects)
+    assert len(ally.active_effects) == 2 and all(fx.duration == 2 for fx in ally.active_effects)
 
     # Act: Mikage uses Base A2 (B_A2), which should increase ally BUFF durations by 1.
     mikage.skill_sequence_cursor = 2
@@ -49,9 +49,9 @@ def test_slice7_mikage_b_a2_increases_ally_buff_durations_by_1() -> None:
     )
 
     # Assert: all ally BUFFs gained +1 duration.
-    assert [fx.duration for fx in mikage.active_effects] == [3, 3]
-    assert [fx.duration for fx in ally.active_effects] == [3, 3]
+    assert len(mikage.active_effects) == 2 and all(fx.duration == 3 for fx in mikage.active_effects)
+    assert len(ally.active_effects) == 2 and all(fx.duration == 3 for fx in ally.active_effects)
 
     # And: at least one EFFECT_DURATION_CHANGED event was emitted.
-    changed = [e for e in sink.events if e.type == EventType.EFFECT_DURATION_CHANGED]
+    changed = sink.by_type(EventType.EFFECT_DURATION_CHANGED)
     assert changed, "Expected at least one EFFECT_DURATION_CHANGED event from B_A2."
@@ -39,7 +39,7 @@ def test_slice2_mikage_base_a3_places_increase_atk_and_cdmg_on_all_allies_for_2_
     assert boss.active_effects == []
 
     # Assert: EFFECT_APPLIED emitted once per buff instance
-    applied = [e for e in sink.events if e.type == EventType.EFFECT_APPLIED]
+    applied = sink.by_type(EventType.EFFECT_APPLIED)
     assert len(applied) == 4
 
     for e in applied:
@@ -18,26 +18,17 @@ Notes:
   via build_mastery_proc_requester_from_battle_path, matching the demo battlespec shape.
 """
 
-import json
-import tempfile
-from pathlib import Path
-
-from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester_from_battle_path, step_tick
-from rsl_turn_sequencing.event_sink import InMemoryEventSink
+from rsl_turn_sequencing.engine import TM_GATE, step_tick
 from rsl_turn_sequencing.events import EventType
-from rsl_turn_sequencing.models import Actor, EffectInstance
-from tests._support.battle_spec_helpers import add_mastery_proc_request, find_champion
-
+from rsl_turn_sequencing.models import EffectInstance
+from tests._support.actors import fresh_mikage_and_ally
+from tests._support.battle_spec_helpers import add_mastery_proc_request_by_name
 
-def _write_battle_spec(tmpdir: Path, battle_spec: dict) -> Path:
-    path = tmpdir / "battle_spec_slice5.json"
-    path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
-    return path
+_PHASE_TURN_END = str(EventType.TURN_END)
 
 
-def test_slice5_engine_owned_mikage_buff_expiration_emits_mastery_proc_when_requested() -> None:
-    mikage = Actor(name="Mikage", speed=100.0)
-    ally = Actor(name="Coldheart", speed=0.0)
+def test_slice5_engine_owned_mikage_buff_expiration_emits_mastery_proc_when_requested(make_requester, sink) -> None:
+    mikage, ally = fresh_mikage_and_ally()
 
     # Force Mikage to act deterministically.
     mikage.turn_meter = float(TM_GATE)
@@ -73,86 +64,74 @@ def test_slice5_engine_owned_mikage_buff_expiration_emits_mastery_proc_when_requ
         "options": {"sequence_policy": "error_if_exhausted"},
     }
 
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-    add_mastery_proc_request(
-        mikage_spec,
+    add_mastery_proc_request_by_name(
+        battle_spec,
+        champion_name="Mikage",
         step=1,
         holder="Mikage",
         mastery="rapid_response",
         count=1,
     )
 
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
-        assert mastery_proc_requester is not None, "Expected requester to be constructed from battle spec."
+    mastery_proc_requester = make_requester(battle_spec)
+    assert mastery_proc_requester is not None, "Expected requester to be constructed from battle spec."
 
-        sink = InMemoryEventSink()
-
-        # Act
-        winner = step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=mastery_proc_requester,
-        )
+    # Act
+    winner = step_tick(
+        [mikage, ally],
+        event_sink=sink,
+        mastery_proc_requester=mastery_proc_requester,
+    )
 
     assert winner is mikage
 
     # Assert: effect removed by engine-owned expiration.
     assert mikage.active_effects == []
 
+    expired = sink.by_type(EventType.EFFECT_EXPIRED)
+    procs = sink.by_type(EventType.MASTERY_PROC)
+
     # Assert: EFFECT_EXPIRED emitted for the instance (Slice 4 payload shape).
-    expired = [e for e in sink.events if e.type == EventType.EFFECT_EXPIRED]
     assert expired, "Expected at least one EFFECT_EXPIRED event (engine-owned expiration)."
 
-    matching_expired = [
-        e
-        for e in expired
-        if e.data.get("instance_id") == "fx_mikage_self_01"
+    matching_expired = any(
+        e.data.get("instance_id") == "fx_mikage_self_01"
         and e.data.get("effect_id") == "increase_atk"
         and e.data.get("effect_kind") == "BUFF"
         and e.data.get("owner") == "Mikage"
         and e.data.get("placed_by") == "Mikage"
         and e.data.get("duration") == 1
         and e.data.get("reason") == "duration_reached_zero"
-        and e.data.get("phase") == str(EventType.TURN_END)
-    ]
+        and e.data.get("phase") == _PHASE_TURN_END
+        for e in expired
+    )
     assert matching_expired, (
         "Expected EFFECT_EXPIRED payload to include instance_id/effect_id/effect_kind/"
         "owner/placed_by/duration/reason/phase for engine-owned expiration."
     )
 
     # Assert: MASTERY_PROC emitted with requested payload.
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
     assert procs, "Expected at least one MASTERY_PROC event."
 
-    matching_procs = [
-        e
-        for e in procs
-        if e.data.get("holder") == "Mikage"
+    matching_procs = any(
+        e.data.get("holder") == "Mikage"
         and e.data.get("mastery") == "rapid_response"
         and e.data.get("count") == 1
         and e.data.get("turn_counter") == 1  # legacy observability only
-    ]
+        for e in procs
+    )
     assert matching_procs, "Expected Rapid Response proc payload holder/mastery/count/turn_counter to match."
 
     # Ordering contract: expiration should precede proc emission for this step.
-    idx_expired = next(
-        i
-        for i, e in enumerate(sink.events)
-        if e.type == EventType.EFFECT_EXPIRED and e.data.get("instance_id") == "fx_mikage_self_01"
+    first_expired = next(e for e in expired if e.data.get("instance_id") == "fx_mikage_self_01")
+    first_proc = next(e for e in procs if e.data.get("turn_counter") == 1)
+    assert (first_expired.tick, first_expired.seq) < (first_proc.tick, first_proc.seq), (
+        "Expected EFFECT_EXPIRED to be emitted before MASTERY_PROC for the same step."
     )
-    idx_proc = next(
-        i
-        for i, e in enumerate(sink.events)
-        if e.type == EventType.MASTERY_PROC and e.data.get("turn_counter") == 1
-    )
-    assert idx_expired < idx_proc, "Expected EFFECT_EXPIRED to be emitted before MASTERY_PROC for the same step."
 
 
-def test_slice5_engine_owned_mikage_buff_expiration_does_not_emit_mastery_proc_without_request() -> None:
-    mikage = Actor(name="Mikage", speed=100.0)
-    ally = Actor(name="Coldheart", speed=0.0)
+def test_slice5_engine_owned_mikage_buff_expiration_does_not_emit_mastery_proc_without_request(empty_requester, sink) -> None:
+    mikage, ally = fresh_mikage_and_ally()
 
     mikage.turn_meter = float(TM_GATE)
     ally.turn_meter = 0.0
@@ -168,29 +147,15 @@ def test_slice5_engine_owned_mikage_buff_expiration_does_not_emit_mastery_proc_w
         )
     ]
 
-    battle_spec = {
-        "boss": {"name": "Boss", "speed": 1500},
-        "champions": [
-            {"slot": 1, "name": "Mikage", "speed": 100.0},
-            {"slot": 2, "name": "Coldheart", "speed": 0.0},
-        ],
-        "options": {"sequence_policy": "error_if_exhausted"},
-    }
-
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
-        assert mastery_proc_requester is not None
+    assert empty_requester is not None
 
-        sink = InMemoryEventSink()
-
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=mastery_proc_requester,
-        )
+    step_tick(
+        [mikage, ally],
+        event_sink=sink,
+        mastery_proc_requester=empty_requester,
+    )
 
     assert mikage.active_effects == []
 
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
+    procs = sink.by_type(EventType.MASTERY_PROC)
     assert procs == [], "Expected no MASTERY_PROC events when no proc request exists for the step."
@@ -48,7 +48,7 @@ def test_mikage_a1_has_no_join_attack_when_no_shadowkin_allies_present() -> None
         tick = sink.current_tick
         tick_events = [e for e in sink.events if e.tick == tick]
         mikage_turn_start = next(
-            (e for e in tick_events if e.type == EventType.TURN_START and e.actor == "Mikage"),
+            (e for e in tick_events if e.type is EventType.TURN_START and e.actor == "Mikage"),
             None,
         )
         if mikage_turn_start is not None:
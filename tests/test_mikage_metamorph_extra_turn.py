@@ -134,4 +134,4 @@ def test_extra_turn_preempts_fill_no_fill_complete_event_emitted() -> None:
     assert ally.turn_meter == 500.0
 
     # No fill event should be emitted on an extra-turn tick.
-    assert all(e.type != EventType.FILL_COMPLETE for e in sink.events)
+    assert not sink.by_type(EventType.FILL_COMPLETE)
@@ -20,23 +20,22 @@ Notes:
 """
 
 import json
-import tempfile
 from pathlib import Path
 
 from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester_from_battle_path, step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
-from tests._support.battle_spec_helpers import add_mastery_proc_request, find_champion
+from tests._support.battle_spec_helpers import add_mastery_proc_request_by_name
 
 
 def _write_battle_spec(tmpdir: Path, battle_spec: dict) -> Path:
     path = tmpdir / "battle_spec_rr_effect_plane.json"
-    path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(battle_spec, separators=(",", ":")), encoding="utf-8")
     return path
 
 
-def test_rapid_response_mastery_proc_increases_mikage_turn_meter_by_10_percent_per_count() -> None:
+def test_rapid_response_mastery_proc_increases_mikage_turn_meter_by_10_percent_per_count(tmp_path: Path) -> None:
     mikage = Actor("Mikage", 100.0)
     coldheart = Actor("Coldheart", 100.0)
 
@@ -76,40 +75,38 @@ def test_rapid_response_mastery_proc_increases_mikage_turn_meter_by_10_percent_p
         "options": {"sequence_policy": "error_if_exhausted"},
     }
 
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-    add_mastery_proc_request(
-        mikage_spec,
+    add_mastery_proc_request_by_name(
+        battle_spec,
+        champion_name="Mikage",
         step=1,
         holder="Mikage",
         mastery="rapid_response",
         count=2,
     )
 
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
-        assert mastery_proc_requester is not None
+    battle_path = _write_battle_spec(tmp_path, battle_spec)
+    mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
+    assert mastery_proc_requester is not None
 
-        sink = InMemoryEventSink()
+    sink = InMemoryEventSink()
 
-        # Act
-        step_tick(
-            [mikage, coldheart],
-            event_sink=sink,
-            mastery_proc_requester=mastery_proc_requester,
-        )
+    # Act
+    step_tick(
+        [mikage, coldheart],
+        event_sink=sink,
+        mastery_proc_requester=mastery_proc_requester,
+    )
 
     # Sanity: MASTERY_PROC was emitted (control plane guardrail).
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
+    procs = sink.by_type(EventType.MASTERY_PROC)
     assert procs, "Expected at least one MASTERY_PROC event."
 
-    matching = [
-        e
-        for e in procs
-        if e.data.get("holder") == "Mikage"
+    matching = any(
+        e.data.get("holder") == "Mikage"
         and e.data.get("mastery") == "rapid_response"
         and e.data.get("count") == 2
-    ]
+        for e in procs
+    )
     assert matching, "Expected Rapid Response proc payload holder/mastery/count to match."
 
     # Assert (effect plane): +10% TM per count, applied to Mikage.
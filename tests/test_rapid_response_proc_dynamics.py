@@ -19,169 +19,118 @@ Non-goals (explicitly excluded):
   - Test-only injection seams
 """
 
-import json
-import tempfile
-from pathlib import Path
+import copy
 
-from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester_from_battle_path, step_tick
-from rsl_turn_sequencing.event_sink import InMemoryEventSink
+import pytest
+
+from rsl_turn_sequencing.engine import TM_GATE, step_tick
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
-from tests._support.battle_spec_helpers import add_mastery_proc_request, find_champion
+from tests._support.actors import fresh_mikage_and_ally
+from tests._support.battle_spec_helpers import add_mastery_proc_request_by_name
 
 
-def _write_battle_spec(tmpdir: Path, battle_spec: dict) -> Path:
-    path = tmpdir / "battle_spec_rr_dynamics.json"
-    path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
-    return path
+_BASE_SPEC: dict = {
+    "boss": {"name": "Boss", "speed": 1500},
+    "champions": [
+        {"slot": 1, "name": "Mikage", "speed": 100.0},
+        {"slot": 2, "name": "Coldheart", "speed": 0.0},
+    ],
+    "options": {"sequence_policy": "error_if_exhausted"},
+}
 
 
 def _base_battle_spec() -> dict:
-    return {
-        "boss": {"name": "Boss", "speed": 1500},
-        "champions": [
-            {"slot": 1, "name": "Mikage", "speed": 100.0},
-            {"slot": 2, "name": "Coldheart", "speed": 0.0},
-        ],
-        "options": {"sequence_policy": "error_if_exhausted"},
-    }
-
-
-def _arrange_mikage_with_expiring_buff(step: int, expirations: int = 1) -> tuple[Actor, Actor]:
-    mikage = Actor(name="Mikage", speed=100.0)
-    ally = Actor(name="Coldheart", speed=0.0)
-
-    mikage.turn_meter = float(TM_GATE)
-    ally.turn_meter = 0.0
-
-    # Skill consumption is not driven by the CLI in unit tests;
-    # we explicitly set the cursor to align with the requested step.
-    mikage.skill_sequence_cursor = step
-
-    expirations_i = int(expirations)
-    if expirations_i < 1:
-        expirations_i = 1
-
-    mikage.active_effects = [
-        EffectInstance(
-            instance_id=f"fx_rr_test_{i+1}",
-            effect_id="increase_atk",
-            effect_kind="BUFF",
-            placed_by="Mikage",
-            duration=1,
+    """Mutable copy of the base spec (for tests that add proc requests)."""
+    return copy.deepcopy(_BASE_SPEC)
+
+
+@pytest.fixture
+def arrange_mikage_with_expiring_buff():
+    """Factory: (step, expirations) -> (mikage, ally) with Mikage ready to act."""
+
+    def _arrange(step: int, expirations: int = 1) -> tuple[Actor, Actor]:
+        mikage, ally = fresh_mikage_and_ally()
+
+        mikage.turn_meter = float(TM_GATE)
+        ally.turn_meter = 0.0
+
+        # Skill consumption is not driven by the CLI in unit tests;
+        # we explicitly set the cursor to align with the requested step.
+        mikage.skill_sequence_cursor = step
+
+        expirations_i = int(expirations)
+        if expirations_i < 1:
+            expirations_i = 1
+
+        mikage.active_effects = [
+            EffectInstance(
+                instance_id=f"fx_rr_test_{i+1}",
+                effect_id="increase_atk",
+                effect_kind="BUFF",
+                placed_by="Mikage",
+                duration=1,
+            )
+            for i in range(expirations_i)
+        ]
+
+        return mikage, ally
+
+    return _arrange
+
+
+@pytest.mark.parametrize(
+    "cursor,expirations,request_step,request_count,expected_count",
+    [
+        # BUFF expires on step 1 and the user requests count=2 for step 1: one proc, count 2.
+        pytest.param(1, 2, 1, 2, 2, id="fires_with_requested_count_on_buff_expiration"),
+        # BUFF expires but no request is declared: no proc.
+        pytest.param(1, 1, None, None, 0, id="does_not_fire_without_user_request"),
+        # BUFF expires on step 2 but the request is for step 1 only: no proc.
+        pytest.param(2, 1, 1, 1, 0, id="is_step_scoped"),
+    ],
+)
+def test_rapid_response_proc_dynamics(
+    make_requester,
+    sink,
+    arrange_mikage_with_expiring_buff,
+    cursor: int,
+    expirations: int,
+    request_step: int | None,
+    request_count: int | None,
+    expected_count: int,
+) -> None:
+    mikage, ally = arrange_mikage_with_expiring_buff(step=cursor, expirations=expirations)
+
+    if request_step is None:
+        battle_spec = _BASE_SPEC
+    else:
+        battle_spec = _base_battle_spec()
+        add_mastery_proc_request_by_name(
+            battle_spec,
+            champion_name="Mikage",
+            step=request_step,
+            holder="Mikage",
+            mastery="rapid_response",
+            count=request_count,
         )
-        for i in range(expirations_i)
-    ]
-
-    return mikage, ally
-
-
-def test_rapid_response_proc_fires_with_requested_count_on_buff_expiration() -> None:
-    """
-    Given:
-      - Mikage BUFF expires at TURN_END
-      - User declares Rapid Response proc for step 1 with count=2
 
-    Expect:
-      - Exactly one MASTERY_PROC event
-      - Payload reflects requested count
-    """
-    mikage, ally = _arrange_mikage_with_expiring_buff(step=1, expirations=2)
+    requester = make_requester(battle_spec)
 
-    battle_spec = _base_battle_spec()
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-
-    add_mastery_proc_request(
-        mikage_spec,
-        step=1,
-        holder="Mikage",
-        mastery="rapid_response",
-        count=2,
+    step_tick(
+        [mikage, ally],
+        event_sink=sink,
+        mastery_proc_requester=requester,
     )
 
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        requester = build_mastery_proc_requester_from_battle_path(battle_path)
-
-        sink = InMemoryEventSink()
-
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=requester,
-        )
+    procs = sink.by_type(EventType.MASTERY_PROC)
+    if expected_count == 0:
+        assert procs == [], "No proc should fire without a matching user request for this step."
+        return
 
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
     assert len(procs) == 1, "Expected exactly one Rapid Response proc event."
 
     proc = procs[0]
     assert proc.data.get("holder") == "Mikage"
     assert proc.data.get("mastery") == "rapid_response"
-    assert proc.data.get("count") == 2
-
-
-def test_rapid_response_proc_does_not_fire_without_user_request() -> None:
-    """
-    Given:
-      - Mikage BUFF expires
-      - No mastery proc request declared
-
-    Expect:
-      - No MASTERY_PROC events
-    """
-    mikage, ally = _arrange_mikage_with_expiring_buff(step=1)
-
-    battle_spec = _base_battle_spec()
-
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        requester = build_mastery_proc_requester_from_battle_path(battle_path)
-
-        sink = InMemoryEventSink()
-
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=requester,
-        )
-
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
-    assert procs == [], "No proc should fire without explicit user intent."
-
-
-def test_rapid_response_proc_is_step_scoped() -> None:
-    """
-    Given:
-      - Mikage expires a BUFF on step 2
-      - User declares proc for step 1 only
-
-    Expect:
-      - No MASTERY_PROC emitted
-    """
-    mikage, ally = _arrange_mikage_with_expiring_buff(step=2)
-
-    battle_spec = _base_battle_spec()
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-
-    add_mastery_proc_request(
-        mikage_spec,
-        step=1,  # mismatched step
-        holder="Mikage",
-        mastery="rapid_response",
-        count=1,
-    )
-
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        requester = build_mastery_proc_requester_from_battle_path(battle_path)
-
-        sink = InMemoryEventSink()
-
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=requester,
-        )
-
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
-    assert procs == [], "Proc must not fire when step does not match user request."
+    assert proc.data.get("count") == expected_count
@@ -3,10 +3,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from tests.test_cli_module import _run_module
+from rsl_turn_sequencing.__main__ import main
 
 
-def test_sequence_policy_error_if_exhausted_fails_fast(tmp_path: Path) -> None:
+def test_sequence_policy_error_if_exhausted_fails_fast(tmp_path: Path, capsys) -> None:
     """Acceptance: sequence_policy=error_if_exhausted should fail as soon as a
     skill_sequence runs out (before skill→hit bridging exists).
 
@@ -27,8 +27,9 @@ def test_sequence_policy_error_if_exhausted_fails_fast(tmp_path: Path) -> None:
     }
 
     path = tmp_path / "battle.json"
-    path.write_text(json.dumps(battle), encoding="utf-8")
+    path.write_text(json.dumps(battle, separators=(",", ":")), encoding="utf-8")
 
-    p = _run_module("run", "--battle", str(path), "--ticks", "5", "--boss-actor", "Boss")
-    assert p.returncode == 2
-    assert "skill_sequence exhausted" in (p.stderr or "")
+    # In-process: the `python -m` entry point itself is covered by test_cli_module.
+    rc = main(["run", "--battle", str(path), "--ticks", "5", "--boss-actor", "Boss"])
+    assert rc == 2
+    assert "skill_sequence exhausted" in capsys.readouterr().err
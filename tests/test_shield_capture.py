@@ -2,6 +2,8 @@ from rsl_turn_sequencing.engine import step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor
+from tests._support.events import last_of_type
+from tests._support.tick import step_ticks
 
 
 def test_turn_start_and_end_emit_boss_shield_snapshot_when_boss_present():
@@ -14,13 +16,13 @@ def test_turn_start_and_end_emit_boss_shield_snapshot_when_boss_present():
 
     # Tick 1: fill only (no one crosses gate yet at ~1000)
     step_tick(actors, event_sink=sink)
-    assert not any(e.type == EventType.TURN_START for e in sink.events)
+    assert not sink.by_type(EventType.TURN_START)
 
     # Tick 2: A1 crosses gate and takes a turn.
     step_tick(actors, event_sink=sink)
 
-    turn_start = [e for e in sink.events if e.type == EventType.TURN_START][-1]
-    turn_end = [e for e in sink.events if e.type == EventType.TURN_END][-1]
+    turn_start = last_of_type(sink.events, EventType.TURN_START)
+    turn_end = last_of_type(sink.events, EventType.TURN_END)
 
     assert turn_start.data["boss_shield_value"] == 21
     assert turn_start.data["boss_shield_status"] == "UP"
@@ -35,19 +37,17 @@ def test_shield_status_reflects_break_between_turns():
     sink = InMemoryEventSink()
 
     # Get one action (Tick 2).
-    step_tick(actors, event_sink=sink)
-    step_tick(actors, event_sink=sink)
+    step_ticks(actors, 2, event_sink=sink)
 
     # "Break" the shield externally (combat not implemented yet).
     boss.shield = 0
 
     # Tick 3: fill only, Tick 4: A1 acts again.
-    step_tick(actors, event_sink=sink)
-    step_tick(actors, event_sink=sink)
+    step_ticks(actors, 2, event_sink=sink)
 
     # The most recent TURN_START/END should report BROKEN.
-    turn_start = [e for e in sink.events if e.type == EventType.TURN_START][-1]
-    turn_end = [e for e in sink.events if e.type == EventType.TURN_END][-1]
+    turn_start = last_of_type(sink.events, EventType.TURN_START)
+    turn_end = last_of_type(sink.events, EventType.TURN_END)
 
     assert turn_start.data["boss_shield_value"] == 0
     assert turn_start.data["boss_shield_status"] == "BROKEN"
@@ -1,22 +1,11 @@
 from rsl_turn_sequencing.engine import step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
-from rsl_turn_sequencing.models import Actor
-
-
-def make_actors():
-    return [
-        Actor("Mikage", 340.0),
-        Actor("Mithrala", 282.0),
-        Actor("Tomblord", 270.0),
-        Actor("Coldheart", 265.0),
-        Actor("Martyr", 252.0),
-        Actor("Boss", 250.0),
-    ]
+from tests._support.actors import make_tick_sheet_actors
 
 
 def test_snapshot_captured_at_turn_end_for_requested_turn():
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
     sink = InMemoryEventSink()
 
     # Request snapshot capture at turn 5
@@ -32,8 +21,8 @@ def test_snapshot_captured_at_turn_end_for_requested_turn():
 
     key = (snapshot_turn, EventType.TURN_END)
 
-    # Snapshot exists
-    assert key in sink.snapshots
+    # Snapshot exists, and only for the requested turn
+    assert list(sink.snapshots) == [key]
 
     snapshot = sink.snapshots[key]
 
@@ -53,7 +42,7 @@ def test_snapshot_captured_at_turn_end_for_requested_turn():
 
 
 def test_no_snapshot_captured_when_not_requested():
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
     sink = InMemoryEventSink()
 
     # Advance several turns with no snapshot_capture argument
@@ -17,21 +17,11 @@ Non-goals:
   - Do not re-assert effect-plane math (other slices cover TM changes).
 """
 
-import json
-import tempfile
-from pathlib import Path
-
-from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester_from_battle_path, step_tick
+from rsl_turn_sequencing.engine import TM_GATE, build_mastery_proc_requester, step_tick
 from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.events import EventType
 from rsl_turn_sequencing.models import Actor, EffectInstance
-from tests._support.battle_spec_helpers import add_mastery_proc_request, find_champion
-
-
-def _write_battle_spec(tmpdir: Path, battle_spec: dict) -> Path:
-    path = tmpdir / "battle_spec_sliceD_success_metadata.json"
-    path.write_text(json.dumps(battle_spec, indent=2), encoding="utf-8")
-    return path
+from tests._support.battle_spec_helpers import add_mastery_proc_request_by_name
 
 
 def test_sliceD_success_proc_includes_causal_metadata_fields() -> None:
@@ -66,32 +56,28 @@ def test_sliceD_success_proc_includes_causal_metadata_fields() -> None:
         "options": {"sequence_policy": "error_if_exhausted"},
     }
 
-    mikage_spec = find_champion(battle_spec, name="Mikage")
-    add_mastery_proc_request(
-        mikage_spec,
+    add_mastery_proc_request_by_name(
+        battle_spec,
+        champion_name="Mikage",
         step=1,
         holder="Mikage",
         mastery="rapid_response",
         count=1,
     )
 
-    with tempfile.TemporaryDirectory() as td:
-        battle_path = _write_battle_spec(Path(td), battle_spec)
-        mastery_proc_requester = build_mastery_proc_requester_from_battle_path(battle_path)
-        assert mastery_proc_requester is not None
+    mastery_proc_requester = build_mastery_proc_requester(battle_spec)
+    assert mastery_proc_requester is not None
 
-        sink = InMemoryEventSink()
+    sink = InMemoryEventSink()
 
-        step_tick(
-            [mikage, ally],
-            event_sink=sink,
-            mastery_proc_requester=mastery_proc_requester,
-        )
-
-    procs = [e for e in sink.events if e.type == EventType.MASTERY_PROC]
-    assert procs, "Expected a MASTERY_PROC event to be emitted."
+    step_tick(
+        [mikage, ally],
+        event_sink=sink,
+        mastery_proc_requester=mastery_proc_requester,
+    )
 
-    proc = procs[0]
+    proc = sink.first_of_type(EventType.MASTERY_PROC)
+    assert proc is not None, "Expected a MASTERY_PROC event to be emitted."
 
     assert proc.data.get("holder") == "Mikage"
     assert proc.data.get("mastery") == "rapid_response"
@@ -1,20 +1,11 @@
 from rsl_turn_sequencing.engine import step_tick
+from rsl_turn_sequencing.event_sink import InMemoryEventSink
 from rsl_turn_sequencing.models import Actor
-
-
-def make_actors():
-    return [
-        Actor("Mikage", 340.0),
-        Actor("Mithrala", 282.0),
-        Actor("Tomblord", 270.0),
-        Actor("Coldheart", 265.0),
-        Actor("Martyr", 252.0),
-        Actor("Boss", 250.0),
-    ]
+from tests._support.actors import make_tick_sheet_actors
 
 
 def test_no_actor_before_threshold():
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
 
     # Advance 4 ticks — nobody should act yet
     for _ in range(4):
@@ -23,7 +14,7 @@ def test_no_actor_before_threshold():
 
 
 def test_mikage_acts_on_tick_5():
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
 
     actor = None
     for _ in range(5):
@@ -47,7 +38,7 @@ def test_sequence_through_tick_10_matches_tick_sheet():
       Tick 9  -> Martyr
       Tick 10 -> Boss
     """
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
 
     actions = []
     for tick in range(1, 11):
@@ -72,7 +63,7 @@ def test_decrease_speed_multiplier_delays_turn_gate_crossing():
     The first action should occur on tick 6 (Mithrala), matching the
     gate-then-tie-break model.
     """
-    actors = make_actors()
+    actors = make_tick_sheet_actors()
 
     # Apply Decrease SPD to Mikage only
     for a in actors:
@@ -90,3 +81,32 @@ def test_decrease_speed_multiplier_delays_turn_gate_crossing():
     actor = step_tick(actors)
     assert actor is not None
     assert actor.name == "Mithrala"
+
+
+def test_tie_break_prefers_speed_then_list_order():
+    # Equal meters past the gate: higher speed wins.
+    a = Actor("A", 100.0, turn_meter=1430.0)
+    b = Actor("B", 200.0, turn_meter=1330.0)
+    assert step_tick([a, b]).name == "B"
+
+    # Equal meters and equal speeds: earlier list position wins.
+    c = Actor("C", 100.0, turn_meter=1430.0)
+    d = Actor("D", 100.0, turn_meter=1430.0)
+    assert step_tick([c, d]).name == "C"
+
+
+def test_sinkless_run_matches_run_with_event_sink():
+    """
+    Event construction is skipped entirely without a sink; that must not change
+    who acts or the resulting meters.
+    """
+    bare = make_tick_sheet_actors()
+    observed = make_tick_sheet_actors()
+    sink = InMemoryEventSink()
+
+    for _ in range(50):
+        a = step_tick(bare)
+        b = step_tick(observed, event_sink=sink)
+        assert (a and a.name) == (b and b.name)
+
+    assert [x.turn_meter for x in bare] == [x.turn_meter for x in observed]